@@ -19,6 +19,7 @@
 
 
 # Standard library imports
+from functools import lru_cache
 import platform
 import re
 
@@ -27,6 +28,7 @@ import re
 # Local application/library specific imports
 
 
+@lru_cache(maxsize=None)
 def is_running_on_macos():
     """
     Returns a truth value for a proposition: "the program is running on a
@@ -38,6 +40,7 @@ def is_running_on_macos():
     return False if not pattern.search(platform.platform()) else True
 
 
+@lru_cache(maxsize=None)
 def is_running_on_windows():
     """
     Returns a truth value for a proposition: "the program is running on a
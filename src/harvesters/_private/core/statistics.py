@@ -40,9 +40,23 @@ class Statistics:
         self._fps = 0.
         self._num_images = 0
         self._fps_max = 0.
+        self._num_discarded_buffers = 0
+        self._num_filled_buffers_max = 0
+        # The timestamp frequency and the way to read the timestamp do not
+        # change during acquisition so that they are resolved on the first
+        # buffer of every acquisition; doing it on every buffer costs GenTL
+        # calls that end up with exceptions on some producers:
+        self._timestamp_freq = None
+        self._get_timestamp = None
+        self._has_resolved_timestamp_freq = False
 
     def update_timestamp(self, buffer):
-        freq = self._get_timestamp_freq(buffer)
+        if not self._has_resolved_timestamp_freq:
+            self._timestamp_freq, self._get_timestamp = \
+                self._resolve_timestamp(buffer)
+            self._has_resolved_timestamp_freq = True
+
+        freq = self._timestamp_freq
         if freq is not None:
             if not self._has_acquired_1st_timestamp:
                 self._timestamp_base = self._get_timestamp(buffer)
@@ -63,19 +77,21 @@ class Statistics:
                 self._fps = self._num_images / self._time_elapsed
 
     @staticmethod
-    def _get_timestamp(buffer):
+    def _get_timestamp_ns(buffer):
         try:
-            timestamp = buffer.timestamp_ns
+            return buffer.timestamp_ns
         except GenTL_GenericException:
-            try:
-                timestamp = buffer.timestamp
-            except GenTL_GenericException:
-                timestamp = 0
-
-        return timestamp
+            return 0
 
     @staticmethod
-    def _get_timestamp_freq(buffer):
+    def _get_timestamp_in_ticks(buffer):
+        try:
+            return buffer.timestamp
+        except GenTL_GenericException:
+            return 0
+
+    @classmethod
+    def _resolve_timestamp(cls, buffer):
         #
         try:
             _ = buffer.timestamp_ns
@@ -83,11 +99,10 @@ class Statistics:
             try:
                 frequency = buffer.parent.parent.timestamp_frequency
             except GenTL_GenericException:
-                return None
+                return None, None
+            return frequency, cls._get_timestamp_in_ticks
         else:
-            frequency = 1000000000  # Hz
-
-        return frequency
+            return 1000000000, cls._get_timestamp_ns  # Hz
 
     def reset(self):
         self._time_base = time.time()
@@ -96,11 +111,30 @@ class Statistics:
         self._fps = 0.
         self._num_images = 0
         self._fps_max = 0.
+        self._num_discarded_buffers = 0
+        self._num_filled_buffers_max = 0
+        self.reset_timestamp_freq()
+
+    def reset_timestamp_freq(self):
+        self._timestamp_freq = None
+        self._get_timestamp = None
+        self._has_resolved_timestamp_freq = False
 
     def increment_num_images(self, num=1):
         self._time_elapsed = time.time() - self._time_base
         self._num_images += num
 
+    def update(self, buffer):
+        self.increment_num_images()
+        self.update_timestamp(buffer)
+
+    def increment_num_discarded_buffers(self, num=1):
+        self._num_discarded_buffers += num
+
+    def update_num_filled_buffers(self, num):
+        if num > self._num_filled_buffers_max:
+            self._num_filled_buffers_max = num
+
     @property
     def fps(self):
         return self._fps
@@ -113,6 +147,14 @@ class Statistics:
     def num_images(self):
         return self._num_images
 
+    @property
+    def num_discarded_buffers(self):
+        return self._num_discarded_buffers
+
+    @property
+    def num_filled_buffers_max(self):
+        return self._num_filled_buffers_max
+
     @property
     def elapsed_time_s(self):
         return self._time_elapsed
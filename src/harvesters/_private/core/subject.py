@@ -30,16 +30,19 @@ class Subject:
         #
         super().__init__()
 
-        #
-        self._observers = []
+        # Observers are registered far less often than they are updated;
+        # keep them in a tuple so that a broadcast iterates over a frozen
+        # snapshot:
+        self._observers = ()
 
     def add_observer(self, observer):
         if observer not in self._observers:
-            self._observers.append(observer)
+            self._observers += (observer,)
 
     def remove_observer(self, observer):
         if observer in self._observers:
-            self._observers.remove(observer)
+            self._observers = tuple(
+                o for o in self._observers if o != observer)
 
     def update_observers(self):
         # Update its observers.
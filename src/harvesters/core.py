@@ -20,30 +20,27 @@
 
 # Standard library imports
 from __future__ import annotations
-from collections.abc import Iterable
+from collections import deque
 from ctypes import CDLL
-from datetime import datetime
 from enum import IntEnum
 import io
 import json
-from logging import Logger
+from logging import Logger, DEBUG
 from math import ceil, isclose
 import ntpath
 import os
-import pathlib
 from queue import Queue
-from queue import Full, Empty
+from queue import Empty
 import re
 import signal
 import sys
-from threading import Lock, Thread, Event
+from threading import Condition, Lock, Thread, Event
 from threading import current_thread, main_thread
 import time
 from typing import Union, List, Optional, Dict, TypeVar, Any, Tuple, Callable
 from urllib.parse import urlparse
 from warnings import warn, simplefilter
 import weakref
-import tempfile
 
 # Related third party imports
 import numpy
@@ -86,6 +83,8 @@ simplefilter(action="once")
 
 _is_logging_buffer = True if 'HARVESTERS_LOG_BUFFER' in os.environ else False
 _sleep_default = 0.000001  # s
+# Is checked against the data format of every delivered buffer:
+_component_2d_formats = frozenset(component_2d_formats)
 
 
 _logger = get_logger(name=__name__)
@@ -106,6 +105,7 @@ class ParameterKey(IntEnum):
     ENABLE_AUTO_CHUNK_DATA_UPDATE = 105  # doc: Determines if you let the :class:`ImageAcquirer` object to automatically update the chunk data when the owner image data is fetched; the value type must be :class:`bool`.
     DEVICE_OWNERSHIP_PRIVILEGE = 106  # doc: Determines the ownership privilege to be applied when the :class:`~harvestesrs.core.ImageAcquirer` object opens a target remote device.
     THREAD_FACTORY_METHOD = 107  # doc: Determines the thread factory method where the corersponding thread worker is bound; the value type must be callable.
+    ENABLE_REUSING_BUFFERS = 108  # doc: Determines if you let the :class:`ImageAcquirer` object keep the buffers after stopping image acquisition and announce them again on the next start; the buffers that are still referred to by the client, e.g., by a NumPy array, are never reused; the value type must be :class:`bool`.
 
     ENABLE_EVENT_MONITOR = 200
     THREAD_FACTORY_METHOD_FOR_EVENT_MODULE = 201
@@ -173,27 +173,20 @@ class ParameterSet:
             _logger.debug("removed parameter; key: {}".format(key.name))
 
 
-def _family_tree(node, tree=""):
-    is_origin = True if tree == "" else False
-
-    try:
-        name = node.id_
-    except AttributeError:
-        name = str(node)
-
-    if is_origin:
-        tree = name
-    else:
-        tree += " :: " + name
+def _family_tree(node):
+    names = []
+    while True:
+        try:
+            names.append(node.id_)
+        except AttributeError:
+            names.append(str(node))
 
-    try:
-        parent = node.parent
-    except AttributeError:
-        return tree
-    else:
-        tree = _family_tree(parent, tree)
+        try:
+            node = node.parent
+        except AttributeError:
+            break
 
-    return tree
+    return " :: ".join(names)
 
 
 def _indicate_deprecation(deprecated: object, alternative: object) -> None:
@@ -211,11 +204,20 @@ def _indicate_deprecation(deprecated: object, alternative: object) -> None:
 
 
 class _Delegate:
+    # Keys: The type of a source object.
+    # Values: The public attribute names of the type; dir() is expensive
+    # and a Buffer wraps a new source object on every fetch:
+    _attributes_by_type = dict()
+
     def __init__(self, source):
         self._source_object = source
-        self._attributes = [
-            f for f in dir(
-                type(self._source_object)) if not f.startswith('_')]
+        source_type = type(source)
+        attributes = self._attributes_by_type.get(source_type)
+        if attributes is None:
+            attributes = frozenset(
+                f for f in dir(source_type) if not f.startswith('_'))
+            self._attributes_by_type[source_type] = attributes
+        self._attributes = attributes
 
     def __getattr__(self, attribute):
         if attribute in self._attributes:
@@ -269,6 +271,11 @@ class _NodeCallbackProxy:
 
 
 class Module(_Delegate):
+    # A module that is not queried by Harvester itself creates its node map
+    # on demand; that spares the enumeration process from loading the
+    # device description files of every system and interface.
+    _creates_node_map_on_demand = True
+
     def __init__(self, *, module, parent, port: Port = None,
                  file_path: Optional[str] = None,
                  file_dict: Optional[Dict[str, bytes]] = None,
@@ -278,10 +285,13 @@ class Module(_Delegate):
         super().__init__(module)
         self._module = module
         self._parent = parent
-        self._node_map = self._create_node_map(
+        self._node_map = None
+        self._node_map_args = dict(
             port=port, file_path=file_path, file_dict=file_dict,
             do_clean_up=do_clean_up, xml_dir_to_store=xml_dir_to_store) if \
             port else None
+        if not self._creates_node_map_on_demand:
+            _ = self.node_map
         self._node_callback_proxy_dict = dict()
 
     def deregister_node_callbacks(self):
@@ -292,7 +302,7 @@ class Module(_Delegate):
                                callback: Optional[Callable[[Node, Any], None]],
                                context: Optional[Any] = None,
                                callback_type: Optional[ECallbackType] = ECallbackType.cbPostOutsideLock) -> Union[None, int]:
-        node = getattr(self._node_map, node_name, None)
+        node = getattr(self.node_map, node_name, None)
         if not node:
             return None
 
@@ -407,7 +417,7 @@ class Module(_Delegate):
             elif location == 'file':
                 file_path_to_load = urlparse(url).path
                 if is_running_on_windows():
-                    file_path_to_load = re.sub(r'^/+', '', file_path_to_load)
+                    file_path_to_load = file_path_to_load.lstrip('/')
 
             elif location == 'http' or location == 'https':
                 raise NotImplementedError(
@@ -457,6 +467,9 @@ class Module(_Delegate):
         NodeMap: The GenICam feature node map that belongs to the owner
         object.
         """
+        if self._node_map is None and self._node_map_args:
+            self._node_map = self._create_node_map(**self._node_map_args)
+            self._node_map_args = None
         return self._node_map
 
     @property
@@ -477,6 +490,8 @@ class DataStream(Module):
 
 class RemoteDevice(Module):
     """Represents a GenTL Remote Device module."""
+    _creates_node_map_on_demand = False
+
     def __init__(self, *, module: _Device, parent=None,
                  file_path: Optional[str] = None,
                  file_dict: Optional[Dict[str, bytes]] = None,
@@ -531,10 +546,12 @@ class DeviceInfo(Module):
     def __init__(self, *, module, parent=None):
         global _logger
         super().__init__(module=module, parent=parent)
-        self._property_dict = dict()
-        self._build_dict()
+        # The dictionary is built on demand because it costs a GenTL call
+        # per search key and most clients never look at it:
+        self._property_dict = None
 
     def _build_dict(self):
+        self._property_dict = dict()
         for p in self.search_keys:
             value = None
             try:
@@ -545,10 +562,12 @@ class DeviceInfo(Module):
 
     @property
     def property_dict(self):
+        if self._property_dict is None:
+            self._build_dict()
         return self._property_dict
 
     def __repr__(self):
-        return str(self._property_dict)
+        return str(self.property_dict)
 
 
 class _SignalHandler:
@@ -696,14 +715,12 @@ class MutexLocker:
         super().__init__()
 
         self._thread = thread
-        self._locked_mutex = None
 
     def __enter__(self):
         if not self._thread:
             return None
 
-        self._locked_mutex = self._thread.acquire()
-        return self._locked_mutex
+        return self._thread.acquire()
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         if not self._thread:
@@ -723,11 +740,12 @@ class _EventMonitor(ThreadBase):
         self._worker = worker
         self._thread = None
         self._parent = parent
+        self._running = Event()
 
     def _internal_start(self):
         self._thread = _NativeThread(parent=self, worker=self._worker)
         self._id = self._thread.id_
-        self._is_running = True
+        self._running.set()
         self._thread.start()
 
     def join(self):
@@ -741,14 +759,13 @@ class _EventMonitor(ThreadBase):
             return
 
         self._thread.stop()
-        self._is_running = False
 
     def acquire(self):
-        return self._thread.acquire() if self._thread else None
+        return self._mutex.acquire() if self._thread else None
 
     def release(self):
         if self._thread:
-            self._thread.release()
+            self._mutex.release()
 
     @property
     def worker(self):
@@ -769,7 +786,7 @@ class _EventMonitor(ThreadBase):
         return self._thread.id_ if self._thread else "Not available"
 
     def is_running(self):
-        return self._is_running
+        return self._running.is_set()
 
 
 class _NativeThread(Thread):
@@ -794,8 +811,7 @@ class _NativeThread(Thread):
             return False
 
     def stop(self):
-        with self._parent.mutex:
-            self._parent._is_running = False
+        self._parent._running.clear()
 
     def run(self):
         """
@@ -804,17 +820,12 @@ class _NativeThread(Thread):
         This method will be terminated once its parent's is_running
         property turns False.
         """
-        while self._parent.is_running():
+        running = self._parent._running
+        while running.is_set():
             if self._worker:
                 self._worker()
             time.sleep(self._sleep)
 
-    def acquire(self):
-        return self._parent.mutex.acquire()
-
-    def release(self):
-        self._parent.mutex.release()
-
     @property
     def id_(self):
         return self.ident
@@ -827,10 +838,6 @@ class _NativeThread(Thread):
     def worker(self, obj):
         self._worker = obj
 
-    @property
-    def mutex(self):
-        return self._parent.mutex
-
 
 class Component:
     """
@@ -909,11 +916,12 @@ class Component2DImage(Component):
     def __init__(
             self, *,
             buffer=None, part=None, node_map: Optional[NodeMap] = None,
-            ):
+            data_format_value: Optional[int] = None):
         """
         :param buffer:
         :param part:
         :param node_map:
+        :param data_format_value: The data format if it is already known.
         """
         assert buffer
         assert node_map
@@ -922,9 +930,20 @@ class Component2DImage(Component):
 
         self._part = part
         self._node_map = node_map
-        proxy = Dictionary.get_proxy(symbolic=self.data_format)
-        self._nr_components = proxy.nr_components
-        self._data = self._to_np_array(proxy)
+        # The following are queried once on demand because each of them
+        # costs a GenTL call and none of them changes while the buffer is
+        # held by the client:
+        self._width = None
+        self._height = None
+        self._data_format_value = data_format_value
+        self._x_offset = None
+        self._y_offset = None
+        self._x_padding = None
+        self._y_padding = None
+        self._proxy = Dictionary.get_proxy_by_value(self.data_format_value)
+        self._nr_components = self._proxy.nr_components
+        # The NumPy array is created on demand; building it costs several
+        # GenTL calls that are wasted if the client never looks at it.
 
     @staticmethod
     def _get_nr_bytes(pf_proxy: _PixelFormat, width: int, height: int) -> int:
@@ -940,42 +959,41 @@ class Component2DImage(Component):
         return int(nr_bytes)
 
     def _to_np_array(self, pf_proxy):
-        padding_x = 0
-        h = 0
-        nr_bytes_per_line = 0
         if self.has_part():
             nr_bytes = self._part.data_size
         else:
-            try:
-                w = self._buffer.width
-            except GenTL_GenericException:
-                w = self._node_map.Width.value
-            try:
-                h = self._buffer.height
-            except GenTL_GenericException:
-                h = self._node_map.Height.value
-
+            # The geometry is shared with the properties so that each of
+            # them costs a GenTL call only once:
             nr_bytes_per_line = self._get_nr_bytes(
-                pf_proxy=pf_proxy, width=w, height=1)
-
-            try:
-                padding_x = self._buffer.padding_x
-            except GenTL_GenericException:
-                padding_x = 0
-
-            nr_bytes = nr_bytes_per_line + padding_x
-            nr_bytes *= h
+                pf_proxy=pf_proxy, width=self.width, height=1)
+            nr_bytes = nr_bytes_per_line + self.x_padding
+            nr_bytes *= self.height
 
+        # The line padding is kept in the array so that it can be viewed
+        # as is; see represent_pixel_location:
         array = numpy.frombuffer(self._buffer.raw_buffer, count=int(nr_bytes),
                                  dtype='uint8', offset=self.data_offset)
 
-        if not self.has_part() and padding_x > 0:
-            array = numpy.reshape(array, (h, nr_bytes_per_line + padding_x))
-            numpy.delete(array, numpy.s_[-1*padding_x:], axis=1)
-            array = numpy.ravel(array)
-
         return pf_proxy.expand(array)
 
+    @property
+    def data(self) -> Union[numpy.ndarray, None]:
+        """
+        Union[numpy.ndarray, None]: The raw image data.
+
+        It is created on the first access so read it before the buffer is
+        queued back; it cannot be created once the buffer has been
+        returned to the GenTL Producer. :const:`None` is returned if the
+        information that is required to create it is not available.
+        """
+        if self._data is None:
+            try:
+                self._data = self._to_np_array(self._proxy)
+            except GenTL_GenericException as e:
+                _logger.warning(e, exc_info=True)
+                return None
+        return self._data
+
     def represent_pixel_location(self) -> Union[numpy.ndarray, None]:
         """
         Returns a NumPy array that represents the 2D pixel location,
@@ -1004,9 +1022,10 @@ class Component2DImage(Component):
         return self._nr_components
 
     def __repr__(self):
+        data = self.data
         return '{} x {}, {}, {} elements,\n{}'.format(
-            self.width, self.height, self.data_format, self.data.size,
-            self.data)
+            self.width, self.height, self.data_format,
+            data.size if data is not None else 0, data)
 
     @property
     def width(self) -> int:
@@ -1014,17 +1033,19 @@ class Component2DImage(Component):
         int: The width of the data component in the buffer in number of
         pixels.
         """
-        try:
-            if self._part:
-                value = self._part.width
-            else:
-                value = self._buffer.width
-        except GenTL_GenericException:
+        if self._width is None:
             try:
-                value = self._node_map.Width.value
-            except AttributeError:
-                value = 0
-        return value
+                if self._part:
+                    value = self._part.width
+                else:
+                    value = self._buffer.width
+            except GenTL_GenericException:
+                try:
+                    value = self._node_map.Width.value
+                except AttributeError:
+                    value = 0
+            self._width = value
+        return self._width
 
     @property
     def height(self) -> int:
@@ -1032,34 +1053,38 @@ class Component2DImage(Component):
         int: The height of the data component in the buffer in number of
         pixels.
         """
-        try:
-            if self._part:
-                value = self._part.height
-            else:
-                value = self._buffer.height
-                if value == 0:
-                    value = self._buffer.delivered_image_height
-        except GenTL_GenericException:
+        if self._height is None:
             try:
-                value = self._node_map.Height.value
-            except AttributeError:
-                value = 0
-        return value
+                if self._part:
+                    value = self._part.height
+                else:
+                    value = self._buffer.height
+                    if value == 0:
+                        value = self._buffer.delivered_image_height
+            except GenTL_GenericException:
+                try:
+                    value = self._node_map.Height.value
+                except AttributeError:
+                    value = 0
+            self._height = value
+        return self._height
 
     @property
     def data_format_value(self) -> int:
         """
         int: The data type of the data component as integer value.
         """
-        try:
-            if self._part:
-                value = self._part.data_format
-            else:
-                value = self._buffer.pixel_format
-        except GenTL_GenericException:
-            value = self._node_map.PixelFormat.get_int_value()
-        assert type(value) is int
-        return value
+        if self._data_format_value is None:
+            try:
+                if self._part:
+                    value = self._part.data_format
+                else:
+                    value = self._buffer.pixel_format
+            except GenTL_GenericException:
+                value = self._node_map.PixelFormat.get_int_value()
+            assert type(value) is int
+            self._data_format_value = value
+        return self._data_format_value
 
     @property
     def data_format(self) -> str:
@@ -1088,14 +1113,16 @@ class Component2DImage(Component):
         int: The X offset of the data in the buffer in number of pixels from
         the image origin to handle areas of interest.
         """
-        try:
-            if self._part:
-                value = self._part.x_offset
-            else:
-                value = self._buffer.offset_x
-        except GenTL_GenericException:
-            value = self._node_map.OffsetX.value
-        return value
+        if self._x_offset is None:
+            try:
+                if self._part:
+                    value = self._part.x_offset
+                else:
+                    value = self._buffer.offset_x
+            except GenTL_GenericException:
+                value = self._node_map.OffsetX.value
+            self._x_offset = value
+        return self._x_offset
 
     @property
     def y_offset(self) -> int:
@@ -1103,14 +1130,16 @@ class Component2DImage(Component):
         int: The Y offset of the data in the buffer in number of pixels from
         the image origin to handle areas of interest.
         """
-        try:
-            if self._part:
-                value = self._part.y_offset
-            else:
-                value = self._buffer.offset_y
-        except GenTL_GenericException:
-            value = self._node_map.OffsetY.value
-        return value
+        if self._y_offset is None:
+            try:
+                if self._part:
+                    value = self._part.y_offset
+                else:
+                    value = self._buffer.offset_y
+            except GenTL_GenericException:
+                value = self._node_map.OffsetY.value
+            self._y_offset = value
+        return self._y_offset
 
     @property
     def x_padding(self) -> int:
@@ -1118,14 +1147,16 @@ class Component2DImage(Component):
         int: The X padding of the data component in the buffer in number of
         pixels.
         """
-        try:
-            if self._part:
-                value = self._part.x_padding
-            else:
-                value = self._buffer.padding_x
-        except GenTL_GenericException:
-            value = 0
-        return value
+        if self._x_padding is None:
+            try:
+                if self._part:
+                    value = self._part.x_padding
+                else:
+                    value = self._buffer.padding_x
+            except GenTL_GenericException:
+                value = 0
+            self._x_padding = value
+        return self._x_padding
 
     @property
     def y_padding(self) -> int:
@@ -1133,14 +1164,16 @@ class Component2DImage(Component):
         int: The Y padding of the data component in the buffer in number of
         pixels.
         """
-        try:
-            if self._part:
-                value = self._part.y_padding
-            else:
-                value = self._buffer.padding_y
-        except GenTL_GenericException:
-            value = 0
-        return value
+        if self._y_padding is None:
+            try:
+                if self._part:
+                    value = self._part.y_padding
+                else:
+                    value = self._buffer.padding_y
+            except GenTL_GenericException:
+                value = 0
+            self._y_padding = value
+        return self._y_padding
 
     def has_part(self):
         return self._part is not None
@@ -1282,35 +1315,9 @@ class Buffer(Module):
         assert node_map
 
         p_type = buffer.payload_type
-        if p_type == PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_UNKNOWN:
-            payload = PayloadUnknown(buffer=buffer)
-
-        elif p_type == PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_IMAGE or \
-                buffer.payload_type == \
-                PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_CHUNK_DATA:
-            payload = PayloadImage(buffer=buffer, node_map=node_map)
-
-        elif p_type == PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_RAW_DATA:
-            payload = PayloadRawData(buffer=buffer)
-
-        elif p_type == PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_FILE:
-            payload = PayloadFile(buffer=buffer)
-
-        elif p_type == PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_JPEG:
-            payload = PayloadJPEG(buffer=buffer)
-
-        elif p_type == PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_JPEG2000:
-            payload = PayloadJPEG2000(buffer=buffer)
-
-        elif p_type == PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_H264:
-            payload = PayloadH264(buffer=buffer)
-
-        elif p_type == PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_CHUNK_ONLY:
-            payload = PayloadChunkOnly(buffer=buffer)
-
-        elif p_type == PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_MULTI_PART:
-            payload = PayloadMultiPart(buffer=buffer, node_map=node_map)
-
+        builder = _payload_builders.get(p_type)
+        if builder:
+            payload = builder(buffer, node_map)
         else:
             info = json.dumps({"payload type": "{}".format(p_type)})
             _logger.warning(
@@ -1378,9 +1385,10 @@ class Payload:
                 raise
 
         symbolic = dict_by_ints[data_format]
-        if symbolic in component_2d_formats:
+        if symbolic in _component_2d_formats:
             return Component2DImage(
-                buffer=buffer, part=part, node_map=node_map
+                buffer=buffer, part=part, node_map=node_map,
+                data_format_value=data_format
             )
         else:
             _logger.warning(message.format(symbolic))
@@ -1538,11 +1546,36 @@ class PayloadMultiPart(Payload):
                     buffer=buffer, part=part, node_map=node_map))
 
     def __repr__(self):
-        ret = ''
-        for i, c in enumerate(self.components):
-            ret += 'Component {}: {}\n'.format(i, c.__repr__())
-        ret = ret[:-1]
-        return ret
+        return '\n'.join(
+            'Component {}: {}'.format(i, c.__repr__())
+            for i, c in enumerate(self.components))
+
+
+_payload_builders = {
+    PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_UNKNOWN:
+        lambda buffer, node_map: PayloadUnknown(buffer=buffer),
+    PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_IMAGE:
+        lambda buffer, node_map: PayloadImage(
+            buffer=buffer, node_map=node_map),
+    PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_CHUNK_DATA:
+        lambda buffer, node_map: PayloadImage(
+            buffer=buffer, node_map=node_map),
+    PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_RAW_DATA:
+        lambda buffer, node_map: PayloadRawData(buffer=buffer),
+    PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_FILE:
+        lambda buffer, node_map: PayloadFile(buffer=buffer),
+    PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_JPEG:
+        lambda buffer, node_map: PayloadJPEG(buffer=buffer),
+    PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_JPEG2000:
+        lambda buffer, node_map: PayloadJPEG2000(buffer=buffer),
+    PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_H264:
+        lambda buffer, node_map: PayloadH264(buffer=buffer),
+    PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_CHUNK_ONLY:
+        lambda buffer, node_map: PayloadChunkOnly(buffer=buffer),
+    PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_MULTI_PART:
+        lambda buffer, node_map: PayloadMultiPart(
+            buffer=buffer, node_map=node_map),
+}
 
 
 class Callback:
@@ -1563,7 +1596,9 @@ class ImageAcquirer:
     Manages everything you need to acquire images from the connecting device.
     """
     _event = Event()
-    _specialized_tl_type = ['U3V', 'GEV']
+    _specialized_tl_type = frozenset(('U3V', 'GEV'))
+    _chunk_adapters = {'U3V': ChunkAdapterU3V, 'GEV': ChunkAdapterGEV}
+    _event_adapters = {'U3V': EventAdapterU3V, 'GEV': EventAdapterGEV}
 
     _supported_parameters = [
         ParameterKey.ENABLE_CLEANING_UP_INTERMEDIATE_FILES,
@@ -1573,6 +1608,7 @@ class ImageAcquirer:
         ParameterKey.TIMEOUT_PERIOD_ON_UPDATE_EVENT_DATA_CALL,
         ParameterKey.TIMEOUT_PERIOD_ON_CLIENT_FETCH_CALL,
         ParameterKey.NUM_BUFFERS_FOR_FETCH_CALL,
+        ParameterKey.ENABLE_REUSING_BUFFERS,
     ]
 
     class Events(IntEnum):
@@ -1587,6 +1623,16 @@ class ImageAcquirer:
         ON_CHUNK_DATA_UPDATED = 5
         ON_EVENT_DATA_UPDATED = 6
 
+    _supported_events = [
+        Events.TURNED_OBSOLETE,
+        Events.RETURN_ALL_BORROWED_BUFFERS,
+        Events.READY_TO_STOP_ACQUISITION,
+        Events.NEW_BUFFER_AVAILABLE,
+        Events.INCOMPLETE_BUFFER,
+        Events.ON_CHUNK_DATA_UPDATED,
+        Events.ON_EVENT_DATA_UPDATED,
+    ]
+
     def _create_acquisition_thread(self) -> _ImageAcquisitionThread:
         return _ImageAcquisitionThread(image_acquire=self)
 
@@ -1615,6 +1661,7 @@ class ImageAcquirer:
         self._file_dict = file_dict
         self._clean_up = ParameterSet.get(ParameterKey.ENABLE_CLEANING_UP_INTERMEDIATE_FILES, True, config)
         self._enable_auto_chunk_data_update = ParameterSet.get(ParameterKey.ENABLE_AUTO_CHUNK_DATA_UPDATE, True, config)
+        self._enable_reusing_buffers = ParameterSet.get(ParameterKey.ENABLE_REUSING_BUFFERS, False, config)
         self._has_attached_chunk = False
 
         env_var = 'HARVESTERS_XML_FILE_DIR'
@@ -1691,6 +1738,13 @@ class ImageAcquirer:
         self._event_new_buffer_thread = \
             self._thread_factory_method_for_event_new_buffer()
         self._event_new_buffer_thread.worker = self._worker_event_new_buffer
+        # Is shared by every critical section rather than being created for
+        # each of them; it keeps no state between entering and exiting and
+        # they all lock the mutex of the same thread:
+        self._event_new_buffer_locker = MutexLocker(
+            self._event_new_buffer_thread)
+        # Wakes up the clients that wait for a filled buffer in the queue:
+        self._new_buffer_condition = Condition()
 
         if current_thread() is main_thread():
             self._sigint_handler = _SignalHandler(
@@ -1705,6 +1759,11 @@ class ImageAcquirer:
 
         self._statistics = Statistics()
         self._announced_buffers = []
+        self._raw_buffers = []
+        # Raw buffers that have been revoked, keyed by their size; they are
+        # reused by the next acquisition instead of allocating new ones if
+        # ENABLE_REUSING_BUFFERS has been set:
+        self._raw_buffer_pool = {}
 
         self._has_acquired_1st_image = False
         self._is_acquiring = False
@@ -1726,6 +1785,9 @@ class ImageAcquirer:
                 num_buffers_default, self._min_num_buffers)
 
         tl_type = self.device.tl_type
+        # The transport layer type is fixed for the device so that we check
+        # it once instead of asking GenTL on every buffer or event:
+        self._is_specialized_tl_type = tl_type in self._specialized_tl_type
         self._chunk_adapter = self._get_chunk_adapter(
             tl_type=tl_type, node_map=self.remote_device.node_map)
         self._event_adapter = self._get_event_adapter(
@@ -1733,18 +1795,7 @@ class ImageAcquirer:
 
         self._finalizer = weakref.finalize(self, self.destroy)
 
-        self._supported_events = [
-            self.Events.TURNED_OBSOLETE,
-            self.Events.RETURN_ALL_BORROWED_BUFFERS,
-            self.Events.READY_TO_STOP_ACQUISITION,
-            self.Events.NEW_BUFFER_AVAILABLE,
-            self.Events.INCOMPLETE_BUFFER,
-            self.Events.ON_CHUNK_DATA_UPDATED,
-            self.Events.ON_EVENT_DATA_UPDATED,
-        ]
-        self._callback_dict = dict()
-        for event in self._supported_events:
-            self._callback_dict[event] = None
+        self._callback_dict = dict.fromkeys(self._supported_events)
 
         self._enable_event_monitor = ParameterSet.get(
             ParameterKey.ENABLE_EVENT_MONITOR, False, config)
@@ -1770,19 +1821,22 @@ class ImageAcquirer:
         global _logger
 
         callbacks = self._callback_dict[event]
-        if isinstance(callbacks, Iterable):
+        if not callbacks:
+            return
+
+        # A single callback is the common case so that it is checked first:
+        if isinstance(callbacks, Callback):
+            self._emit_callback(callbacks)
+        else:
             for callback in callbacks:
                 self._emit_callback(callback)
-        else:
-            callback = callbacks
-            self._emit_callback(callback)
 
     def _emit_callback(
             self,
             callback: Optional[Union[Callback, List[Callback]]]) -> None:
         if callback:
             if isinstance(callback, Callback):
-                _logger.debug("going to emit: {0}".format(callback))
+                _logger.debug("going to emit: %s", callback)
                 callback.emit(context=self)
             else:
                 raise TypeError
@@ -1810,21 +1864,15 @@ class ImageAcquirer:
 
     @staticmethod
     def _get_chunk_adapter(*, tl_type: str, node_map: NodeMap):
-        if tl_type == 'U3V':
-            return ChunkAdapterU3V(node_map)
-        elif tl_type == 'GEV':
-            return ChunkAdapterGEV(node_map)
-        else:
-            return ChunkAdapterGeneric(node_map)
+        adapter = ImageAcquirer._chunk_adapters.get(
+            tl_type, ChunkAdapterGeneric)
+        return adapter(node_map)
 
     @staticmethod
     def _get_event_adapter(*, tl_type: str, node_map: NodeMap):
-        if tl_type == 'U3V':
-            return EventAdapterU3V(node_map.pointer)
-        elif tl_type == 'GEV':
-            return EventAdapterGEV(node_map.pointer)
-        else:
-            return EventAdapterGeneric(node_map.pointer)
+        adapter = ImageAcquirer._event_adapters.get(
+            tl_type, EventAdapterGeneric)
+        return adapter(node_map.pointer)
 
     def __enter__(self):
         return self
@@ -1876,6 +1924,7 @@ class ImageAcquirer:
 
         self._release_data_streams()
         self._release_remote_device()
+        self._raw_buffer_pool.clear()
 
         self._new_buffer_event_monitor_dict.clear()
         self._module_event_monitor_dict.clear()
@@ -1936,21 +1985,36 @@ class ImageAcquirer:
         global _logger
 
         if value > 0:
-            self._num_buffers_to_hold = value
+            if value == self._num_buffers_to_hold:
+                # Nothing to rebuild; the held buffers stay as they are:
+                return
 
-            buffers = []
-            while not self._queue.empty():
-                buffers.append(self._queue.get_nowait())
+            discarded_buffers = []
+            with self._event_new_buffer_locker:
+                self._num_buffers_to_hold = value
 
-            self._queue = Queue(maxsize=self._num_buffers_to_hold)
+                buffers = deque()
+                while True:
+                    try:
+                        buffers.append(self._queue.get_nowait())
+                    except Empty:
+                        break
 
-            while len(buffers) > 0:
-                try:
-                    self._queue.put(buffers.pop(0))
-                except Full as e:
-                    _logger.debug(e, exc_info=True)
-                    buffer = buffers.pop(0)
-                    buffer.parent.queue_buffer(buffer)
+                self._queue = Queue(maxsize=self._num_buffers_to_hold)
+
+                # Keep the latest ones as the worker does when the queue
+                # is full; the older ones are given back to the GenTL
+                # Producer once the mutex has been released:
+                while len(buffers) > self._num_buffers_to_hold:
+                    discarded_buffers.append(buffers.popleft())
+                self._statistics.increment_num_discarded_buffers(
+                    len(discarded_buffers))
+
+                for buffer in buffers:
+                    self._queue.put_nowait(buffer)
+
+            for buffer in discarded_buffers:
+                buffer.parent.queue_buffer(buffer)
 
         else:
             raise ValueError(
@@ -2258,7 +2322,14 @@ class ImageAcquirer:
                 ds.start_acquisition(
                     ACQ_START_FLAGS_LIST.ACQ_START_FLAGS_DEFAULT, -1)
 
+            # Drop what has not been reused; e.g., the payload size has
+            # been changed since the last acquisition:
+            self._raw_buffer_pool.clear()
+
             self._has_attached_chunk = False
+            # Let the first buffer resolve the timestamp frequency again in
+            # case the producer could not provide it the last time:
+            self._statistics.reset_timestamp_freq()
             self._is_acquiring = True
 
             if run_as_thread:
@@ -2281,25 +2352,26 @@ class ImageAcquirer:
         :return: None
         """
         global _logger
+        timeout_on_update = self._timeout_on_internal_fetch_call
         for monitor in self._module_event_monitor_dict.values():
             if not self._is_valid or not self._event_adapter:
                 return
 
             try:
-                monitor.update_event_data(self.timeout_period_on_update_event_data_call)
+                monitor.update_event_data(timeout_on_update)
             except TimeoutException:
                 continue
             except GenTL_GenericException as e:
                 _logger.debug(e, exc_info=True)
             else:
-                _logger.debug("going to deliver an event: {}".format(monitor))
-                if self._device_proxy.tl_type in self._specialized_tl_type:
+                _logger.debug("going to deliver an event: %s", monitor)
+                if self._is_specialized_tl_type:
                     self._event_adapter.deliver_message(monitor.optional_data)
                 else:
                     self._event_adapter.deliver_message(monitor.optional_data,
                                                         monitor.event_id)
                 self._emit_callbacks(self.Events.ON_EVENT_DATA_UPDATED)
-                _logger.debug("just delivered an event: {}".format(monitor))
+                _logger.debug("just delivered an event: %s", monitor)
 
     def _worker_event_new_buffer(self) -> None:
         """
@@ -2309,20 +2381,55 @@ class ImageAcquirer:
         """
         global _logger
 
-        queue = self._queue
+        # Resolve what does not change during a pass once:
+        fetch = self._fetch
+        emit_callbacks = self._emit_callbacks
+        locker = self._event_new_buffer_locker
+        condition = self._new_buffer_condition
+        timeout = self.timeout_period_on_client_fetch_call
+        num_buffers = self._num_buffers
+        event = self.Events.NEW_BUFFER_AVAILABLE
+        statistics = self._statistics
 
         for monitor in self._new_buffer_event_monitor_dict.values():
-            buffer = self._fetch(monitor=monitor,
-                                 timeout_period_on_client_fetch_call=self.timeout_period_on_client_fetch_call)
-            if buffer:
-                with MutexLocker(self._event_new_buffer_thread):
+            buffer = fetch(monitor=monitor,
+                           timeout_period_on_client_fetch_call=timeout)
+            # Up to the number of announced buffers can be drained at once
+            # so that the other data streams are not starved:
+            num_buffers_to_drain = num_buffers
+            while buffer:
+                # Only swap the buffers while holding the mutex; the
+                # discarded one is given back to the GenTL Producer once
+                # the mutex has been released:
+                _buffer = None
+                with locker:
                     if not self._is_acquiring:
                         return
+                    queue = self._queue
                     if queue.full():
-                        _buffer = queue.get()
-                        _buffer.parent.queue_buffer(_buffer)
-                    queue.put(buffer)
-                self._emit_callbacks(self.Events.NEW_BUFFER_AVAILABLE)
+                        try:
+                            _buffer = queue.get_nowait()
+                        except Empty:
+                            pass
+                        else:
+                            statistics.increment_num_discarded_buffers()
+                    queue.put_nowait(buffer)
+                    statistics.update_num_filled_buffers(queue.qsize())
+                with condition:
+                    condition.notify()
+                if _buffer:
+                    _buffer.parent.queue_buffer(_buffer)
+                emit_callbacks(event)
+
+                num_buffers_to_drain -= 1
+                if num_buffers_to_drain <= 0:
+                    break
+
+                # Drain the buffers that have already been delivered before
+                # handing the control back to the thread loop; a single
+                # attempt is made if nothing is ready:
+                buffer = fetch(monitor=monitor,
+                               timeout_period_on_client_fetch_call=sys.float_info.min)
 
     def _update_chunk_data(self, *, buffer: _Buffer, is_manual: bool):
         global _logger
@@ -2345,7 +2452,7 @@ class ImageAcquirer:
                     _logger.debug('contains chunk data: {0}'.format(
                         _family_tree(buffer)))
 
-        if buffer.tl_type not in self._specialized_tl_type:
+        if not self._is_specialized_tl_type:
             try:
                 self._chunk_adapter.attach_buffer(
                     buffer.raw_buffer,
@@ -2419,67 +2526,111 @@ class ImageAcquirer:
         buffer = None
         watch_timeout = True if timeout_period_on_client_fetch_call > 0 else False
         base = time.time()
+        # These do not change while waiting for a buffer:
+        update_event_data = monitor.update_event_data
+        timeout_on_update = self._timeout_on_internal_fetch_call
 
         while not buffer:
-            if watch_timeout:
-                elapsed = time.time() - base
-                if elapsed > timeout_period_on_client_fetch_call:
-                    if _is_logging_buffer:
-                        _logger.debug(
-                            'timeout: elapsed {0} sec.'.format(
-                                timeout_period_on_client_fetch_call))
-                    if throw_except:
-                        raise TimeoutException
-                    else:
-                        return None
-
             try:
-                monitor.update_event_data(self.timeout_period_on_update_event_data_call)
+                update_event_data(timeout_on_update)
             except TimeoutException:
+                # The period is checked after each attempt so that a
+                # buffer that has already been delivered is always picked
+                # up however short the period is:
+                if watch_timeout:
+                    elapsed = time.time() - base
+                    if elapsed > timeout_period_on_client_fetch_call:
+                        if _is_logging_buffer:
+                            _logger.debug(
+                                'timeout: elapsed {0} sec.'.format(
+                                    timeout_period_on_client_fetch_call))
+                        if throw_except:
+                            raise TimeoutException
+                        else:
+                            return None
                 continue
             except GenTL_GenericException as e:
                 _logger.error(e, exc_info=True)
                 raise
             else:
+                _buffer = monitor.buffer
                 context = None
                 frame_id = None
                 try:
-                    is_complete = monitor.buffer.is_complete()
+                    is_complete = _buffer.is_complete()
                     if _is_logging_buffer:
-                        context = monitor.buffer.context
-                        frame_id = monitor.buffer.frame_id
+                        context = _buffer.context
+                        frame_id = _buffer.frame_id
                 except GenTL_GenericException:
                     is_complete = False
 
                 if is_complete:
                     self._update_num_images_to_acquire()
-                    self._update_statistics(monitor.buffer)
-                    buffer = monitor.buffer
+                    self._update_statistics(_buffer)
+                    buffer = _buffer
                     if _is_logging_buffer:
                         _logger.debug(
                             'fetched: {0} (#{1}); {2}'.format(
-                                context, frame_id,
-                                _family_tree(monitor.buffer)))
+                                context, frame_id, _family_tree(_buffer)))
                 else:
                     _logger.warning(
                         'incomplete or not available; discarded: {}'.format(
-                            _family_tree(monitor.buffer)))
+                            _family_tree(_buffer)))
 
-                    ds = monitor.buffer.parent
-                    ds.queue_buffer(monitor.buffer)
+                    ds = _buffer.parent
+                    ds.queue_buffer(_buffer)
+                    self._statistics.increment_num_discarded_buffers()
                     self._emit_callbacks(self.Events.INCOMPLETE_BUFFER)
                     return None
 
         return buffer
 
-    def _try_fetch_from_queue(
-            self, *, is_raw: bool = False) -> Union[Buffer, _Buffer, None]:
-        with MutexLocker(self._event_new_buffer_thread):
-            try:
-                raw_buffer = self._queue.get(block=False)
-                return self._finalize_fetching_process(raw_buffer, is_raw)
-            except Empty:
-                return None
+    def _fetch_from_queue(
+            self, *, timeout: float = 0, is_raw: bool = False,
+            cycle_s: float = None) -> Union[Buffer, _Buffer, None]:
+        # The wait is split into cycles so that the end of the acquisition
+        # is picked up even if no buffer comes:
+        cycle_s = cycle_s if cycle_s else 0.1
+        expiration = time.time() + timeout if timeout > 0 else None
+        condition = self._new_buffer_condition
+
+        raw_buffer = None
+        while not raw_buffer:
+            period = cycle_s
+            if expiration:
+                period = max(min(period, expiration - time.time()), 0)
+
+            # The condition is held until the wait begins so that the
+            # notification of a buffer that arrives after the check below
+            # is not missed; the worker only notifies after it has released
+            # the mutex:
+            with condition:
+                # The buffer is taken while holding the mutex as the worker
+                # and num_filled_buffers_to_hold do:
+                with self._event_new_buffer_locker:
+                    # The buffer is no longer usable once the acquisition
+                    # has been stopped:
+                    if not self._is_acquiring:
+                        return None
+                    try:
+                        raw_buffer = self._queue.get_nowait()
+                    except Empty:
+                        pass
+
+                if not raw_buffer:
+                    if expiration and time.time() >= expiration:
+                        if _is_logging_buffer:
+                            _logger.debug(
+                                'timeout: elapsed {0} sec.'.format(timeout))
+                        raise TimeoutException
+
+                    condition.wait(period)
+
+        # The buffer is finalized without holding any lock because it may
+        # call back the client; stop may have been called in the meantime:
+        if not self._is_acquiring:
+            return None
+        return self._finalize_fetching_process(raw_buffer, is_raw)
 
     def _finalize_fetching_process(
             self, raw_buffer: _Buffer, is_raw: bool) -> Union[Buffer, _Buffer, None]:
@@ -2546,24 +2697,16 @@ class ImageAcquirer:
 
         if self._event_new_buffer_thread and \
                 self._event_new_buffer_thread.is_running():
-            buffer = None
-            while not buffer:
-                buffer = self._try_fetch_from_queue(is_raw=is_raw)
-                if not buffer:
-                    time.sleep(cycle_s if cycle_s else 0.0001)
-                else:
-                    return buffer
+            return self._fetch_from_queue(
+                timeout=timeout, is_raw=is_raw, cycle_s=cycle_s)
         else:
             buffers = []
             for monitor in self._new_buffer_event_monitor_dict.values():
                 buffer = None
                 while not buffer:
-                    try:
-                        buffer = self._fetch(monitor=monitor,
-                                             timeout_period_on_client_fetch_call=timeout,
-                                             throw_except=True)
-                    except GenTL_GenericException:
-                        raise
+                    buffer = self._fetch(monitor=monitor,
+                                         timeout_period_on_client_fetch_call=timeout,
+                                         throw_except=True)
                 buffers.append(self._finalize_fetching_process(buffer, is_raw))
             return buffers if len(self._new_buffer_event_monitor_dict.values()) > 1 else buffers[0]
 
@@ -2576,32 +2719,37 @@ class ImageAcquirer:
 
     def _update_statistics(self, buffer) -> None:
         assert buffer
-        self._statistics.increment_num_images()
-        self._statistics.update_timestamp(buffer)
+        self._statistics.update(buffer)
 
     def _create_raw_buffers(
             self, num_buffers: int = 0, size: int = 0) -> List[bytes]:
         assert num_buffers >= 0
         assert size >= 0
 
-        raw_buffers = []
-        for _ in range(num_buffers):
-            _logger.debug(
-                "allocated: {0} bytes by {1}".format(size, self))
-            raw_buffers.append(bytes(size))
+        # Free the ones that do not fit before allocating new ones so that
+        # both are not held at once; e.g., the payload size has changed:
+        for _size in [_size for _size in self._raw_buffer_pool if _size != size]:
+            del self._raw_buffer_pool[_size]
 
+        pool = self._raw_buffer_pool.get(size, [])
+        raw_buffers = pool[:num_buffers]
+        del pool[:num_buffers]
+
+        num_reused = len(raw_buffers)
+        num_to_allocate = num_buffers - num_reused
+        raw_buffers.extend(bytes(size) for _ in range(num_to_allocate))
+        _logger.debug(
+            "allocated: {0} x {1} bytes, reused: {2} by {3}".format(
+                num_to_allocate, size, num_reused, self))
+
+        self._raw_buffers.extend(raw_buffers)
         return raw_buffers
 
     @staticmethod
     def _create_buffer_tokens(raw_buffers: List[bytes] = None):
         assert raw_buffers
 
-        _buffer_tokens = []
-        for i, buffer in enumerate(raw_buffers):
-            _buffer_tokens.append(
-                BufferToken(buffer, i))
-
-        return _buffer_tokens
+        return [BufferToken(buffer, i) for i, buffer in enumerate(raw_buffers)]
 
     def _announce_buffers(
             self, data_stream: DataStream = None,
@@ -2610,12 +2758,16 @@ class ImageAcquirer:
 
         assert data_stream
 
+        # Composing the family tree costs several GenTL calls per buffer:
+        is_debugging = _logger.isEnabledFor(DEBUG)
+
         announced_buffers = []
         for token in _buffer_tokens:
             announced_buffer = data_stream.announce_buffer(token)
             announced_buffers.append(announced_buffer)
-            _logger.debug(
-                'announced: {0}'.format(_family_tree(announced_buffer)))
+            if is_debugging:
+                _logger.debug(
+                    'announced: {0}'.format(_family_tree(announced_buffer)))
 
         return announced_buffers
 
@@ -2626,9 +2778,12 @@ class ImageAcquirer:
 
         assert data_stream
 
+        is_debugging = _logger.isEnabledFor(DEBUG)
+
         for buffer in buffers:
             data_stream.queue_buffer(buffer)
-            _logger.debug('queued: {0}'.format(_family_tree(buffer)))
+            if is_debugging:
+                _logger.debug('queued: {0}'.format(_family_tree(buffer)))
 
     def stop_image_acquisition(self):
         """
@@ -2653,6 +2808,10 @@ class ImageAcquirer:
     def stop(self) -> None:
         """
         Stops image acquisition process.
+
+        The buffers are freed unless :data:`ParameterKey.ENABLE_REUSING_BUFFERS`
+        has been set; in that case, the ones that are not referred to by the
+        client anymore are kept and announced again on the next start.
         """
         global _logger
 
@@ -2663,7 +2822,7 @@ class ImageAcquirer:
                 self._event_new_buffer_thread.stop()
                 self._event_new_buffer_thread.join()
 
-            with MutexLocker(self._event_new_buffer_thread):
+            with self._event_new_buffer_locker:
                 try:
                     self.remote_device.node_map.AcquisitionStop.execute()
                 except GenApi_GenericException as e:
@@ -2731,18 +2890,38 @@ class ImageAcquirer:
     def _release_buffers(self) -> None:
         global _logger
 
+        is_debugging = _logger.isEnabledFor(DEBUG)
+
         for data_stream in self._data_streams:
             if data_stream.is_open():
                 self._flush_buffers(data_stream)
                 for buffer in self._announced_buffers:
-                    name = _family_tree(buffer)
+                    # The name must be composed before the buffer is revoked:
+                    name = _family_tree(buffer) if is_debugging else None
                     _ = data_stream.revoke_buffer(buffer)
-                    _logger.debug('revoked: {0}'.format(name))
+                    if is_debugging:
+                        _logger.debug('revoked: {0}'.format(name))
 
         self._announced_buffers.clear()
 
-        while not self._queue.empty():
-            _ = self._queue.get_nowait()
+        # The revoked raw buffers can be announced again unless the client
+        # still refers to them; otherwise they are freed here:
+        if self._enable_reusing_buffers:
+            for raw_buffer in self._raw_buffers:
+                # The list, the loop variable and the argument hold three:
+                if sys.getrefcount(raw_buffer) > 3:
+                    continue
+                self._raw_buffer_pool.setdefault(
+                    len(raw_buffer), []).append(raw_buffer)
+        self._raw_buffers.clear()
+
+        # A client may take a buffer at the same time so the emptiness of
+        # the queue is not checked in advance:
+        while True:
+            try:
+                _ = self._queue.get_nowait()
+            except Empty:
+                break
 
 
 def _save_file(
@@ -2751,11 +2930,14 @@ def _save_file(
         file_dict: Dict[str, bytes] = None):
     global _logger
 
+    # Only needed when a device description file has to be stored:
+    from datetime import datetime
+    import pathlib
+    import tempfile
+
     assert binary_data
     assert file_name
 
-    bytes_io = io.BytesIO(binary_data)
-
     if xml_dir_to_store is not None:
         if not os.path.exists(xml_dir_to_store):
             os.makedirs(xml_dir_to_store)
@@ -2767,7 +2949,9 @@ def _save_file(
     file_path = os.path.join(xml_dir_to_store, _file_name)
 
     mode = 'w+'
-    data_to_write = bytes_io.getvalue()
+    # Write what the port has given as is; going through a BytesIO
+    # object would copy the whole file twice:
+    data_to_write = binary_data
     if pathlib.Path(file_path).suffix.lower() != '.zip':
         data_to_write = _drop_padding_data(
             data_to_write, file_name=_file_name, file_dict=file_dict)
@@ -2824,6 +3008,28 @@ def _drop_padding_data(
         return data_to_write
 
 
+def _compose_message(status: int, solution: int) -> str:
+    status_dict = {
+        0: "no device available",
+        1: "no device found",
+        2: "multiple devices found",
+        3: "undefined search key given"
+    }
+    solution_dict = {
+        0: "check the system setup",
+        1: "provide sufficient search key",
+        2: "provide valid device information",
+        3: "provide valid search key",
+    }
+    return ": ".join([status_dict.get(status), solution_dict.get(solution)])
+
+
+# The error messages that Harvester.create raises are composed once:
+_messages_on_create = {
+    key: _compose_message(*key) for key in [(0, 0), (1, 1), (2, 1), (3, 3)]
+}
+
+
 class _CallbackDestroyImageAcquirer(Callback):
     def __init__(self, harvester):
         self._harvester = harvester
@@ -2847,6 +3053,11 @@ class Harvester:
         ParameterKey._ENABLE_PROFILE,
         ParameterKey.TIMER,
     ]
+    _access_flags = {
+        'exclusive': DEVICE_ACCESS_FLAGS_LIST.DEVICE_ACCESS_EXCLUSIVE,
+        'control': DEVICE_ACCESS_FLAGS_LIST.DEVICE_ACCESS_CONTROL,
+        'read_only': DEVICE_ACCESS_FLAGS_LIST.DEVICE_ACCESS_READONLY,
+    }
 
     def __init__(self, *, profile=False, logger: Optional[Logger] = None,
                  do_clean_up: bool = True,
@@ -3023,23 +3234,6 @@ class Harvester:
             the mapped device ownership is released.
 
         """
-
-        def compose_message(status: int, solution: int) -> str:
-            status_dict = {
-                0: "no device available",
-                1: "no device found",
-                2: "multiple devices found",
-                3: "undefined search key given"
-            }
-            solution_dict = {
-                0: "check the system setup",
-                1: "provide sufficient search key",
-                2: "provide valid device information",
-                3: "provide valid search key",
-            }
-            return ": ".join([status_dict.get(status),
-                              solution_dict.get(solution)])
-
         parent = None
         if type(search_key) is int:
             raw_device = self.device_info_list[search_key].create_device()
@@ -3051,26 +3245,25 @@ class Harvester:
             else:
                 raise ValueError(1, 2)
         elif type(search_key) is dict:
-            candidate_devices = self.device_info_list.copy()
+            candidate_devices = self.device_info_list
             for key in search_key.keys():
                 value = search_key.get(key)
                 if value:
-                    to_be_dropped = []
+                    remaining = []
                     for candidate in candidate_devices:
                         try:
                             if value != getattr(candidate, key, None):
-                                to_be_dropped.append(candidate)
+                                continue
                         except GenTL_GenericException as e:
                             _logger.debug(e, exc_info=True)
-                            continue
-                    for candidate in to_be_dropped:
-                        candidate_devices.remove(candidate)
+                        remaining.append(candidate)
+                    candidate_devices = remaining
 
             num_candidates = len(candidate_devices)
             if num_candidates > 1:
-                raise ValueError(compose_message(2, 1))
+                raise ValueError(_messages_on_create[(2, 1)])
             elif num_candidates == 0:
-                raise ValueError(compose_message(1, 1))
+                raise ValueError(_messages_on_create[(1, 1)])
             else:
                 raw_device = candidate_devices[0].create_device()
                 parent = candidate_devices[0].parent
@@ -3079,9 +3272,9 @@ class Harvester:
                 raw_device = self.device_info_list[0].create_device()
                 parent = self.device_info_list[0].parent
             else:
-                raise ValueError(compose_message(0, 0))
+                raise ValueError(_messages_on_create[(0, 0)])
         else:
-            raise ValueError(compose_message(3, 3))
+            raise ValueError(_messages_on_create[(3, 3)])
 
         assert parent
         device_proxy = Device(module=raw_device, parent=parent)
@@ -3092,15 +3285,10 @@ class Harvester:
                          file_dict=None):
         privilege = ParameterSet.get(ParameterKey.DEVICE_OWNERSHIP_PRIVILEGE, 'exclusive', config)
         try:
-            if privilege == 'exclusive':
-                _privilege = DEVICE_ACCESS_FLAGS_LIST.DEVICE_ACCESS_EXCLUSIVE
-            elif privilege == 'control':
-                _privilege = DEVICE_ACCESS_FLAGS_LIST.DEVICE_ACCESS_CONTROL
-            elif privilege == 'read_only':
-                _privilege = DEVICE_ACCESS_FLAGS_LIST.DEVICE_ACCESS_READONLY
-            else:
+            if privilege not in self._access_flags:
                 raise NotImplementedError(
                     'not supported: {}'.format(privilege))
+            _privilege = self._access_flags[privilege]
 
             device_proxy.open(_privilege)
             device_proxy_ = Device(module=device_proxy.module, parent=device_proxy.parent)
@@ -3466,9 +3654,9 @@ class Harvester:
                         self._ifaces.append(iface_)
 
                         raw_iface.update_device_info_list(self.timeout_for_update)
-                        for dev_info in raw_iface.device_info_list:
-                            self.device_info_list.append(
-                                DeviceInfo(module=dev_info, parent=iface_))
+                        self._device_info_list.extend(
+                            [DeviceInfo(module=dev_info, parent=iface_)
+                             for dev_info in raw_iface.device_info_list])
 
         except GenTL_GenericException as e:
             _logger.warning(e, exc_info=True)
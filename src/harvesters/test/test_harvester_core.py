@@ -36,6 +36,7 @@ from genicam.genapi import GenericException as GenApi_GenericException
 from genicam.genapi import NodeMap
 from genicam.genapi import register, deregister
 from genicam.gentl import TimeoutException
+from genicam.gentl import GenericException as GenTL_GenericException
 import numpy as np
 
 # Local application/library specific imports
@@ -50,7 +51,7 @@ from harvesters.core import ImageAcquirer
 from harvesters.core import _drop_padding_data
 from harvesters.core import Module
 from harvesters.core import _NodeCallbackProxy
-from harvesters.util.pfnc import Dictionary
+from harvesters.util.pfnc import Dictionary, dict_by_names
 from harvesters.core import Component2DImage
 from harvesters.util.pfnc import Mono8, Mono10, Mono12, Mono14, Mono16
 from harvesters.util.pfnc import Mono10Packed, Mono12Packed
@@ -159,6 +160,51 @@ class TestHarvesterCore(TestHarvester):
             # Stop image acquisition.
             ia.stop()
 
+    def test_data_read_after_other_properties(self):
+        # Prepare an image acquirer for device #0.
+        ia = self.harvester.create_image_acquirer(0)
+        ia.start()
+
+        with ia.fetch() as buffer:
+            component = buffer.payload.components[0]
+
+            # Read the geometry before the data is created on demand:
+            width = component.width
+            height = component.height
+            x_padding = component.x_padding
+            y_padding = component.y_padding
+
+            # It must be the same as the one that is created first:
+            reference = Component2DImage(
+                buffer=buffer.module, node_map=ia.remote_device.node_map)
+            self.assertTrue(np.array_equal(reference.data, component.data))
+            self.assertEqual(
+                (height + y_padding,
+                 int(width * component.num_components_per_pixel + x_padding)),
+                component.represent_pixel_location().shape)
+
+        ia.stop()
+        ia.destroy()
+
+    def test_data_not_available(self):
+        class _Part:
+            width = 1
+            height = 1
+            data_offset = 0
+
+            @property
+            def data_size(self):
+                raise GenTL_GenericException('not available', '', '', 0)
+
+        component = Component2DImage(
+            buffer=object(), part=_Part(), node_map=object(),
+            data_format_value=dict_by_names['Mono8'])
+
+        # The failure must not reach the client:
+        self.assertIsNone(component.data)
+        self.assertIsNone(component.represent_pixel_location())
+        self.assertTrue(repr(component))
+
     def test_multiple_image_acquirers(self):
         if not self.is_running_with_default_target():
             return
@@ -308,6 +354,120 @@ class TestHarvesterCore(TestHarvester):
         ia.stop()
         ia.destroy()
 
+    def test_timeout_on_fetching_buffer_as_thread(self):
+        if not self.is_running_with_default_target():
+            return
+
+        # Create an image acquirer:
+        ia = self.harvester.create_image_acquirer(0)
+
+        # Setup the device for software trigger mode:
+        ia.remote_device.node_map.TriggerMode.value = 'On'
+        ia.remote_device.node_map.TriggerSource.value = 'Software'
+
+        # We're ready to start image acquisition in the background:
+        ia.start(run_as_thread=True)
+
+        timeout = 3  # sec
+
+        self._logger.info("you will see timeout but that's intentional.")
+        with self.assertRaises(TimeoutException):
+            # Try to fetch a buffer but the IA will raise TimeoutException
+            # because we've not triggered the device so far:
+            _ = ia.fetch(timeout=timeout)
+
+        # We finally acquire an image triggering the device:
+        ia.remote_device.node_map.TriggerSoftware.execute()
+        buffer = ia.fetch(timeout=timeout)
+        self.assertIsNotNone(buffer)
+        self._logger.info('{0}'.format(buffer))
+        buffer.queue()
+
+        # Now we stop image acquisition:
+        ia.stop()
+        ia.destroy()
+
+    def test_statistics_on_discarded_buffers(self):
+        # Create an image acquirer:
+        ia = self.harvester.create_image_acquirer(0)
+
+        # Announce enough buffers so that the device can keep delivering
+        # images while some of them are held:
+        ia.num_buffers = 6
+        ia.num_filled_buffers_to_hold = 3
+
+        # Let the device deliver images in the background without fetching
+        # any of them; the queue must fill up and the older ones must be
+        # discarded:
+        ia.start(run_as_thread=True)
+        time.sleep(1)
+        self.assertEqual(3, ia.statistics.num_filled_buffers_max)
+        num_discarded_buffers = ia.statistics.num_discarded_buffers
+        self.assertGreater(num_discarded_buffers, 0)
+
+        # Shrinking the queue discards the older ones that it holds:
+        ia.num_filled_buffers_to_hold = 1
+        self.assertGreaterEqual(
+            ia.statistics.num_discarded_buffers, num_discarded_buffers + 2)
+
+        # Give enough room to the queue and keep fetching; nothing must be
+        # discarded anymore:
+        ia.num_filled_buffers_to_hold = 4
+        num_discarded_buffers = ia.statistics.num_discarded_buffers
+        base = time.time()
+        while time.time() - base < 1:
+            with ia.fetch(timeout=3):
+                pass
+        self.assertEqual(
+            num_discarded_buffers, ia.statistics.num_discarded_buffers)
+
+        ia.stop()
+        ia.destroy()
+
+    def test_reusing_raw_buffers(self):
+        # Create an image acquirer that reuses its buffers:
+        ia = self.harvester.create(
+            0, config=ParameterSet({
+                ParameterKey.ENABLE_REUSING_BUFFERS: True}))
+
+        ia.start()
+        raw_buffers = [id(b) for b in ia._raw_buffers]
+        ia.stop()
+
+        # The same raw buffers must be announced again:
+        ia.start()
+        self.assertEqual(raw_buffers, [id(b) for b in ia._raw_buffers])
+        ia.stop()
+
+        # The ones that do not fit must be dropped before allocating:
+        self.assertTrue(ia._raw_buffer_pool)
+        _ = ia._create_raw_buffers(1, 1)
+        self.assertEqual([], [size for size in ia._raw_buffer_pool if size != 1])
+
+        ia.destroy()
+
+    def test_keeping_data_across_restart(self):
+        for reuses_buffers in [False, True]:
+            ia = self.harvester.create(
+                0, config=ParameterSet({
+                    ParameterKey.ENABLE_REUSING_BUFFERS: reuses_buffers}))
+
+            # Keep an array that refers to a buffer of the first run:
+            ia.start()
+            with ia.fetch(timeout=3) as buffer:
+                data = buffer.payload.components[0].data
+            ia.stop()
+            expected = data.copy()
+
+            # The following images must not be written to the array:
+            ia.start()
+            for _ in range(ia.num_buffers + 1):
+                with ia.fetch(timeout=3):
+                    self.assertTrue(np.array_equal(expected, data))
+            ia.stop()
+
+            ia.destroy()
+
     def test_releasing_resource_on_update_call(self):
         #
         acquires = []
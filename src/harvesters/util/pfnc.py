@@ -27,6 +27,10 @@ import numpy
 
 # Local application/library specific imports
 from harvesters.util._pfnc import symbolics as _symbolics
+from harvesters.util.logging import get_logger
+
+
+_logger = get_logger(name=__name__)
 
 #
 symbolics = _symbolics
@@ -576,6 +580,15 @@ class _Location(IntEnum):
     BAYER = 7
 
 
+_data_size_in_bit = {
+    _DataSize.INT8: 8,
+    _DataSize.UINT8: 8,
+    _DataSize.UINT16: 16,
+    _DataSize.UINT32: 32,
+    _DataSize.FLOAT32: 32,
+}
+
+
 class _Alignment:
     def __init__(self, unpacked: IntEnum, packed: Optional[IntEnum] = None):
         #
@@ -589,6 +602,9 @@ class _Alignment:
             assert size > 0
             assert (size % 4) == 0
         assert self._get_size(self._unpacked) >= self._get_size(self._packed)
+        # These are read for every fetched image so resolve them once:
+        self._unpacked_size = self._get_size(self._unpacked) / 8
+        self._is_packed = self._unpacked != self._packed
 
     def __repr__(self):
         repr = ''
@@ -604,24 +620,20 @@ class _Alignment:
 
     @property
     def unpacked_size(self):
-        return self._get_size(self.unpacked) / 8
+        return self._unpacked_size
 
     @property
     def packed(self):
         return self._packed
 
     def is_packed(self):
-        return self._unpacked != self._packed
+        return self._is_packed
 
     @staticmethod
     def _get_size(index: IntEnum):
-        if (index == _DataSize.INT8) or (index == _DataSize.UINT8):
-            return 8
-        elif index == _DataSize.UINT16:
-            return 16
-        elif (index == _DataSize.UINT32) or (index == _DataSize.FLOAT32):
-            return 32
-        else:
+        try:
+            return _data_size_in_bit[index]
+        except KeyError:
             raise ValueError
 
 
@@ -3214,25 +3226,26 @@ class Dictionary:
         BGR10p(),
         BGR12p(),
     ]
+    _proxies = {pf.symbolic: pf for pf in _pixel_formats}
+    _proxies_by_value = {
+        dict_by_names[pf.symbolic]: pf for pf in _pixel_formats
+        if pf.symbolic in dict_by_names}
 
     def __init__(self):
         #
         super().__init__()
         #
         for p in Dictionary._pixel_formats:
-            print(p)
+            _logger.debug('%s', p)
         pass
 
     @classmethod
     def get_proxy(cls, symbolic: str):
-        #
-        _pf = None
-        for pf in Dictionary._pixel_formats:
-            if symbolic == pf.symbolic:
-                _pf = pf
-                break
-        #
-        return _pf
+        return Dictionary._proxies.get(symbolic)
+
+    @classmethod
+    def get_proxy_by_value(cls, value: int):
+        return Dictionary._proxies_by_value.get(value)
 
     @classmethod
     def get_pixel_formats(cls):